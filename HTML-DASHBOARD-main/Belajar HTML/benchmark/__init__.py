@@ -0,0 +1,37 @@
+"""Benchmark dan uji beban untuk app.py.
+
+Dijalankan dari folder "Belajar HTML" (tempat app.py):
+
+    python -m benchmark --db sqlite:///bench.db isi-data --hari 365 --hapus
+    python -m benchmark --db sqlite:///bench.db mikro --simpan mikro.json
+    python -m benchmark --db sqlite:///bench.db beban --kasir 8 --esp32 2 --owner 2 --durasi 60
+    python -m benchmark --db sqlite:///bench.db startup --ulang 10
+    python -m benchmark --db sqlite:///bench.db checkout --item 1,10,50
+    python -m benchmark --db sqlite:///stres.db stres --kasir 200 --esp32 100 --hapus
+    python -m benchmark --db sqlite:///bench.db sse --penonton 0,100,300
+    python -m benchmark --db sqlite:///ekspor.db ekspor --baris 10000,1000000
+
+- isi-data : data sintetis yang deterministik (seed) untuk roti, user, produksi,
+             transaksi_penjualan, detail_transaksi dan ringkasan_baru, lalu
+             stok_harian / stok_roti dibangun ulang dari ledger.
+- mikro    : waktu setiap query laporan di /data_produksi, /api/data_laporan
+             dan /data_produksi_kasir, langsung dan lewat route.
+- beban    : kasir checkout, ESP32 kirim produksi dan owner membuka laporan
+             bersamaan; throughput dan p50/p95/p99 per endpoint.
+- peramalan: peramalan produksi NumPy dibanding loop per roti.
+- startup  : import app.py, create_app() dan request pertama, masing-masing
+             di proses Python baru (cold start / worker recycle).
+- checkout : round trip database dan p50/p95 POST /simpan_transaksi per
+             ukuran keranjang.
+- stres    : ratusan kasir dan ESP32 menulis bersamaan ke database kosong;
+             exit 1 jika stok akhir != produksi - penjualan.
+- sse      : ratusan stream /stream/stok terbuka sambil kasir checkout;
+             query database per checkout tidak boleh naik dengan jumlah
+             penonton (--gunicorn: juga thread yang dipegang stream).
+- ekspor   : byte pertama, waktu total dan RSS puncak ekspor per hari
+             (csv, ndjson, excel, dan jalur Excel lama) untuk 10 ribu dan
+             1 juta baris stok_harian yang diisi sendiri.
+
+`--simpan` menulis hasil ke JSON, `--banding` membandingkan dengan hasil
+yang disimpan sebelumnya supaya regresi antar rilis terlihat.
+"""
@@ -0,0 +1,230 @@
+import argparse
+import os
+import platform
+import sys
+from datetime import date
+
+KOLOM_MIKRO = ("jumlah", "min_ms", "p50_ms", "p95_ms", "p99_ms", "maks_ms")
+KOLOM_BEBAN = ("jumlah", "error", "per_detik", "p50_ms", "p95_ms", "p99_ms", "maks_ms")
+KOLOM_PAYLOAD = ("byte", "gzip_byte", "br_byte", "p50_ms", "p95_ms")
+KOLOM_CHECKOUT = ("jumlah", "error", "query", "round_trip", "p50_ms", "p95_ms", "p99_ms", "maks_ms")
+KOLOM_SSE = ("stream", "ditolak", "event", "jumlah", "error", "per_detik", "p95_ms", "query_dtk", "query_ckt")
+KOLOM_EKSPOR = ("baris", "error", "ukuran_mb", "ttfb_ms", "total_ms", "rss_mb", "naik_mb")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark app.py")
+    parser.add_argument("--db", help="URL database, mis. sqlite:///bench.db (default: DATABASE_URL / app.py)")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p = sub.add_parser("isi-data", help="isi database dengan data sintetis")
+    p.add_argument("--hari", type=int, default=365)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--roti", type=int, default=12)
+    p.add_argument("--kasir", type=int, default=3)
+    p.add_argument("--transaksi-per-hari", type=int, default=120)
+    p.add_argument("--sampai", type=date.fromisoformat, help="tanggal terakhir (default hari ini)")
+    p.add_argument("--hapus", action="store_true", help="kosongkan semua tabel dulu")
+    p.add_argument("--outlet", type=int, default=1, help="jumlah outlet")
+
+    pm = sub.add_parser("mikro", help="microbenchmark query laporan")
+    pm.add_argument("--ulang", type=int, default=50)
+    pm.add_argument("--tanggal", type=date.fromisoformat, help="default tanggal terakhir di stok_harian")
+
+    pb = sub.add_parser("beban", help="uji beban campuran")
+    pb.add_argument("--kasir", type=int, default=4)
+    pb.add_argument("--esp32", type=int, default=2)
+    pb.add_argument("--owner", type=int, default=1)
+    pb.add_argument("--durasi", type=float, default=30, help="detik")
+    pb.add_argument("--jeda", type=float, default=0.0, help="rata-rata jeda antar aksi per pengguna (detik)")
+    pb.add_argument("--seed", type=int, default=42)
+    pb.add_argument("--url", help="server yang sedang berjalan; default test client di proses ini")
+    pb.add_argument("--roti", type=int, default=12, help="jumlah roti dari isi-data")
+    pb.add_argument("--akun-kasir", type=int, default=3, help="jumlah akun kasir dari isi-data")
+    pb.add_argument("--outlet", type=int, default=1, help="jumlah outlet dari isi-data (tujuan produksi ESP32)")
+
+    pp = sub.add_parser("peramalan", help="peramalan NumPy dibanding loop per roti")
+    pp.add_argument("--minggu", default="8,52,156", help="panjang riwayat yang diuji, dipisah koma")
+    pp.add_argument("--ulang", type=int, default=5)
+
+    ps = sub.add_parser("startup", help="import, create_app dan request pertama di proses baru")
+    ps.add_argument("--ulang", type=int, default=10)
+
+    pl = sub.add_parser("payload", help="ukuran dan waktu parse /api/data_laporan v1 vs v2")
+    pl.add_argument("--ulang", type=int, default=200)
+    pl.add_argument("--tanggal", type=date.fromisoformat, help="default tanggal terakhir di stok_harian")
+
+    pk = sub.add_parser("skala", help="throughput beban campuran vs jumlah worker gunicorn")
+    pk.add_argument("--worker", default="1,2,4", help="jumlah worker yang diuji, dipisah koma")
+    pk.add_argument("--thread", type=int, default=8, help="thread per worker")
+    pk.add_argument("--port", type=int, default=5055)
+    pk.add_argument("--kasir", type=int, default=16)
+    pk.add_argument("--esp32", type=int, default=4)
+    pk.add_argument("--owner", type=int, default=4)
+    pk.add_argument("--durasi", type=float, default=30, help="detik per jumlah worker")
+    pk.add_argument("--roti", type=int, default=12, help="jumlah roti dari isi-data")
+    pk.add_argument("--akun-kasir", type=int, default=3, help="jumlah akun kasir dari isi-data")
+    pk.add_argument("--outlet", type=int, default=1, help="jumlah outlet dari isi-data")
+
+    pc = sub.add_parser("checkout", help="round trip dan latensi checkout per ukuran keranjang")
+    pc.add_argument("--item", default="1,10,50", help="jumlah item per keranjang, dipisah koma")
+    pc.add_argument("--ulang", type=int, default=200)
+    pc.add_argument("--roti", type=int, default=12, help="jumlah roti dari isi-data")
+
+    pt = sub.add_parser("stres", help="konsistensi stok saat ratusan kasir & ESP32 menulis bersamaan")
+    pt.add_argument("--kasir", type=int, default=200)
+    pt.add_argument("--esp32", type=int, default=100)
+    pt.add_argument("--ulang", type=int, default=5, help="aksi per kasir / ESP32")
+    pt.add_argument("--roti", type=int, default=6)
+    pt.add_argument("--outlet", type=int, default=2)
+    pt.add_argument("--seed", type=int, default=42)
+    pt.add_argument("--url", help="server yang sedang berjalan dengan database --db; default test client")
+    pt.add_argument("--hapus", action="store_true", help="kosongkan semua tabel dulu")
+
+    pe = sub.add_parser("sse", help="dashboard SSE terbuka vs checkout dan query database per detik")
+    pe.add_argument("--penonton", default="0,100,300", help="jumlah stream yang dibuka, dipisah koma")
+    pe.add_argument("--kasir", type=int, default=8)
+    pe.add_argument("--durasi", type=float, default=20, help="detik checkout per jumlah penonton")
+    pe.add_argument("--url", help="server yang sedang berjalan (satu worker); default test client")
+    pe.add_argument("--gunicorn", action="store_true", help="jalankan gunicorn gthread lokal seperti skala")
+    pe.add_argument("--worker", type=int, default=1)
+    pe.add_argument("--thread", type=int, default=8, help="thread per worker")
+    pe.add_argument("--port", type=int, default=5056)
+    pe.add_argument("--sse-maks", type=int, help="FLASK_SSE_MAKS untuk gunicorn (default app)")
+    pe.add_argument("--roti", type=int, default=12, help="jumlah roti dari isi-data")
+    pe.add_argument("--akun-kasir", type=int, default=3, help="jumlah akun kasir dari isi-data")
+
+    px = sub.add_parser("ekspor", help="byte pertama dan RSS ekspor per hari: csv, ndjson, excel vs excel lama")
+    px.add_argument("--baris", default="10000,1000000", help="jumlah baris stok_harian per ekspor, dipisah koma")
+    px.add_argument("--format", default="csv,ndjson,excel,excel lama", help="format yang diuji, dipisah koma")
+    px.add_argument("--seed", type=int, default=42)
+    px.add_argument("--hapus", action="store_true", help="kosongkan semua tabel dulu")
+
+    for p in (pm, pb, pp, ps, pl, pk, pc, pt, pe, px):
+        p.add_argument("--simpan", help="tulis hasil ke file JSON")
+        p.add_argument("--banding", help="bandingkan dengan file JSON hasil sebelumnya")
+
+    args = parser.parse_args(argv)
+    # create_app() membaca DATABASE_URL; startup juga meneruskannya ke proses anak
+    if args.db:
+        os.environ["DATABASE_URL"] = args.db
+
+    from benchmark import statistik
+    info = {"perintah": args.perintah, "python": platform.python_version(),
+            "db": os.environ.get("DATABASE_URL", "app.py")}
+
+    from app import create_app
+    app = create_app()
+
+    if args.perintah == "isi-data":
+        from benchmark import data
+        data.isi_data(app, hari=args.hari, seed=args.seed, jumlah_roti=args.roti, jumlah_kasir=args.kasir,
+                      transaksi_per_hari=args.transaksi_per_hari, sampai=args.sampai, hapus=args.hapus,
+                      jumlah_outlet=args.outlet)
+        return
+
+    if args.perintah == "startup":
+        from benchmark import startup
+        hasil, openpyxl = startup.jalankan(ulang=args.ulang)
+        info.update(ulang=args.ulang)
+        print(f"{args.ulang} proses baru, openpyxl dimuat saat start: {'ya' if openpyxl else 'tidak'}")
+        statistik.cetak_tabel(hasil, KOLOM_MIKRO)
+        kunci = "p50_ms"
+    elif args.perintah == "peramalan":
+        from benchmark import peramalan
+        minggu = [int(m) for m in args.minggu.split(",")]
+        hasil = peramalan.jalankan(app, daftar_minggu=minggu, ulang=args.ulang)
+        info.update(minggu=minggu, ulang=args.ulang)
+        statistik.cetak_tabel(hasil, KOLOM_MIKRO)
+        kunci = "p50_ms"
+    elif args.perintah == "payload":
+        from benchmark import payload
+        tanggal, hasil = payload.jalankan(app, ulang=args.ulang, tanggal=args.tanggal)
+        info.update(tanggal=tanggal, ulang=args.ulang)
+        print(f"Tanggal acuan {tanggal}, semua outlet; p50/p95 = json.loads body tanpa kompresi")
+        statistik.cetak_tabel(hasil, KOLOM_PAYLOAD)
+        kunci = "gzip_byte"
+    elif args.perintah == "skala":
+        from benchmark import skala
+        worker = [int(w) for w in args.worker.split(",")]
+        hasil = skala.jalankan(daftar_worker=worker, thread=args.thread, port=args.port, kasir=args.kasir,
+                               esp32=args.esp32, owner=args.owner, durasi=args.durasi, jumlah_roti=args.roti,
+                               akun_kasir=args.akun_kasir, jumlah_outlet=args.outlet)
+        info.update(worker=worker, thread=args.thread, kasir=args.kasir, esp32=args.esp32, owner=args.owner,
+                    durasi=args.durasi)
+        statistik.cetak_tabel(hasil, KOLOM_BEBAN)
+        kunci = "p95_ms"
+    elif args.perintah == "stres":
+        from benchmark import stres
+        hasil, beda = stres.jalankan(app, kasir=args.kasir, esp32=args.esp32, ulang=args.ulang,
+                                     jumlah_roti=args.roti, jumlah_outlet=args.outlet, url=args.url,
+                                     seed=args.seed, hapus=args.hapus)
+        info.update(kasir=args.kasir, esp32=args.esp32, ulang=args.ulang, url=args.url)
+        print(f"{args.kasir} kasir, {args.esp32} ESP32, {args.ulang} aksi masing-masing")
+        statistik.cetak_tabel(hasil, KOLOM_BEBAN)
+        for baris in beda[:50]:
+            print(f"[BEDA] {baris}")
+        if beda:
+            print(f"stok TIDAK konsisten: {len(beda)} perbedaan")
+        else:
+            print("stok konsisten: stok_roti dan stok_harian = produksi - penjualan untuk setiap outlet & roti")
+        kunci = "p95_ms"
+    elif args.perintah == "sse":
+        from benchmark import sse
+        penonton = [int(n) for n in args.penonton.split(",")]
+        hasil = sse.jalankan(app, daftar_penonton=penonton, kasir=args.kasir, durasi=args.durasi, url=args.url,
+                             gunicorn=args.gunicorn, worker=args.worker, thread=args.thread, port=args.port,
+                             sse_maks=args.sse_maks, akun_kasir=args.akun_kasir, jumlah_roti=args.roti)
+        info.update(penonton=penonton, kasir=args.kasir, durasi=args.durasi, url=args.url,
+                    gunicorn=args.gunicorn, worker=args.worker, thread=args.thread, sse_maks=args.sse_maks)
+        print(f"{args.kasir} kasir, {args.durasi:g} detik per baris; event = event stok rata-rata per stream, "
+              "query_dtk / query_ckt = query database per detik / per checkout")
+        statistik.cetak_tabel(hasil, KOLOM_SSE)
+        kunci = "query_ckt"
+    elif args.perintah == "ekspor":
+        from benchmark import ekspor
+        baris = [int(n) for n in args.baris.split(",")]
+        daftar_format = args.format.split(",")
+        hasil = ekspor.jalankan(app, daftar_baris=baris, daftar_format=daftar_format, seed=args.seed,
+                                hapus=args.hapus)
+        info.update(baris=baris, format=daftar_format)
+        print("Satu proses baru per ekspor; ttfb_ms = byte pertama, rss_mb = RSS puncak proses, "
+              "naik_mb = kenaikan selama request")
+        statistik.cetak_tabel(hasil, KOLOM_EKSPOR)
+        kunci = "rss_mb"
+    elif args.perintah == "checkout":
+        from benchmark import checkout
+        item = [int(i) for i in args.item.split(",")]
+        hasil = checkout.jalankan(app, daftar_item=item, ulang=args.ulang, jumlah_roti=args.roti)
+        info.update(item=item, ulang=args.ulang)
+        print(f"{args.ulang} checkout per ukuran keranjang; query dan round_trip rata-rata per checkout")
+        statistik.cetak_tabel(hasil, KOLOM_CHECKOUT)
+        kunci = "p95_ms"
+    elif args.perintah == "mikro":
+        from benchmark import mikro
+        tanggal, hasil = mikro.jalankan(app, ulang=args.ulang, tanggal=args.tanggal)
+        info.update(tanggal=tanggal, ulang=args.ulang)
+        print(f"Tanggal acuan {tanggal}, {args.ulang} ulangan")
+        statistik.cetak_tabel(hasil, KOLOM_MIKRO)
+        kunci = "p50_ms"
+    else:
+        from benchmark import beban
+        hasil = beban.jalankan(app, kasir=args.kasir, esp32=args.esp32, owner=args.owner, durasi=args.durasi,
+                               jeda=args.jeda, seed=args.seed, url=args.url, jumlah_roti=args.roti,
+                               akun_kasir=args.akun_kasir, jumlah_outlet=args.outlet)
+        info.update(kasir=args.kasir, esp32=args.esp32, owner=args.owner, durasi=args.durasi,
+                    jeda=args.jeda, url=args.url)
+        print(f"{args.kasir} kasir, {args.esp32} ESP32, {args.owner} owner, {args.durasi:g} detik")
+        statistik.cetak_tabel(hasil, KOLOM_BEBAN)
+        kunci = "p95_ms"
+
+    if args.simpan:
+        statistik.simpan(args.simpan, hasil, info)
+    if args.banding:
+        statistik.banding(args.banding, hasil, kunci)
+    if args.perintah == "stres" and beda:
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
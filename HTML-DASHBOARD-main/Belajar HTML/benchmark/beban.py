@@ -0,0 +1,199 @@
+"""Load driver beban campuran: kasir, ESP32 dan owner berjalan bersamaan.
+
+Setiap pengguna virtual adalah satu thread dengan klien dan cookie sendiri.
+Tanpa --url, request dikirim ke app di proses yang sama lewat test client;
+dengan --url, ke server yang sedang berjalan lewat HTTP. Akun dan idRoti
+mengikuti data dari isi-data (owner/owner, kasir1/kasir1, roti 1..N, outlet 1..M).
+"""
+import http.cookiejar
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import timedelta
+
+from benchmark.statistik import ringkas
+
+
+class KlienLokal:
+    """Klien lewat app.test_client(), tanpa server HTTP."""
+
+    def __init__(self, app):
+        self._klien = app.test_client()
+
+    def minta(self, metode, path, json_body=None, form=None, isi=False, headers=None):
+        r = self._klien.open(path, method=metode, json=json_body, data=form, headers=headers)
+        body = r.get_data()
+        return (r.status_code, body) if isi else r.status_code
+
+    def buka(self, path):
+        """GET tanpa menunggu body selesai: (status, potongan body, fungsi tutup)."""
+        r = self._klien.get(path, buffered=False)
+        return r.status_code, r.response, r.close
+
+
+class KlienHttp:
+    """Klien HTTP dengan cookie jar sendiri (satu sesi login per pengguna)."""
+
+    def __init__(self, url):
+        self._url = url.rstrip('/')
+        self._opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def minta(self, metode, path, json_body=None, form=None, isi=False, headers=None):
+        """Status HTTP, atau (status, body) jika `isi`."""
+        headers = dict(headers or {})
+        data = None
+        if json_body is not None:
+            data = json.dumps(json_body).encode()
+            headers['Content-Type'] = 'application/json'
+        elif form is not None:
+            data = urllib.parse.urlencode(form).encode()
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        req = urllib.request.Request(self._url + path, data=data, headers=headers, method=metode)
+        try:
+            with self._opener.open(req, timeout=60) as r:
+                body = r.read()
+                return (r.status, body) if isi else r.status
+        except urllib.error.HTTPError as e:
+            return (e.code, e.read()) if isi else e.code
+
+    def buka(self, path):
+        """GET tanpa menunggu body selesai: (status, baris body, fungsi tutup)."""
+        r = self._opener.open(self._url + path, timeout=60)
+        return r.status, r, r.close
+
+
+class Pengguna(threading.Thread):
+    """Satu terminal / perangkat; subclass mengisi langkah()."""
+
+    def __init__(self, klien, rng, berhenti, jeda, opsi):
+        super().__init__(daemon=True)
+        self.klien = klien
+        self.rng = rng
+        self.berhenti = berhenti
+        self.jeda = jeda
+        self.opsi = opsi
+        self.latensi = {}
+        self.error = {}
+
+    def ukur(self, label, metode, path, **kwargs):
+        mulai = time.perf_counter()
+        try:
+            status = self.klien.minta(metode, path, **kwargs)
+        except Exception:
+            status = None
+        self.latensi.setdefault(label, []).append(time.perf_counter() - mulai)
+        if status is None or status >= 400:
+            self.error[label] = self.error.get(label, 0) + 1
+        return status
+
+    def login(self):
+        pass
+
+    def run(self):
+        self.login()
+        while not self.berhenti.is_set():
+            self.langkah()
+            if self.jeda:
+                self.berhenti.wait(self.rng.expovariate(1 / self.jeda))
+
+
+class Kasir(Pengguna):
+    def __init__(self, nomor, *args):
+        super().__init__(*args)
+        self.nomor = nomor
+
+    def login(self):
+        akun = f"kasir{self.nomor}"
+        self.ukur("POST /login", 'POST', '/login', form={"username": akun, "password": akun})
+
+    def langkah(self):
+        self.ukur("GET /Hitung_Total", 'GET', '/Hitung_Total')
+        ids = self.rng.sample(range(1, self.opsi['jumlah_roti'] + 1), self.rng.choice((1, 1, 2, 2, 3, 4)))
+        items = [{"idRoti": idRoti, "qty": self.rng.choice((1, 1, 2, 3))} for idRoti in ids]
+        total = sum(item["qty"] for item in items) * 7000
+        self.ukur("POST /simpan_transaksi", 'POST', '/simpan_transaksi', json_body={
+            "total": total, "bayar": total, "kembalian": 0, "items": items})
+
+
+class Esp32(Pengguna):
+    def langkah(self):
+        idRoti = self.rng.randint(1, self.opsi['jumlah_roti'])
+        idOutlet = self.rng.randint(1, self.opsi['jumlah_outlet'])
+        if self.rng.random() < 0.8:
+            self.ukur("POST /esp32/input_produksi", 'POST', '/esp32/input_produksi', json_body={
+                "idRoti": idRoti, "idUser": 1, "idOutlet": idOutlet, "Jumlah_Produksi": self.rng.choice((12, 24, 36))})
+            return
+        # Kiriman tertunda: beberapa record sekaligus lewat endpoint batch
+        records = [{"idRoti": self.rng.randint(1, self.opsi['jumlah_roti']), "idUser": 1, "idOutlet": idOutlet,
+                    "Jumlah_Produksi": 12, "idempotency_key": f"{self.opsi['run']}-{self.name}-{self.rng.getrandbits(32):x}"}
+                   for _ in range(10)]
+        self.ukur("POST /esp32/input_produksi_batch", 'POST', '/esp32/input_produksi_batch',
+                  json_body={"records": records})
+
+
+class Owner(Pengguna):
+    def login(self):
+        self.ukur("POST /login", 'POST', '/login', form={"username": "owner", "password": "owner"})
+
+    def langkah(self):
+        tanggal = (self.opsi['tanggal'] - timedelta(days=self.rng.randint(0, 90))).isoformat()
+        periode = self.rng.choice(('none', '7', '30', '90'))
+        pilihan = self.rng.random()
+        if pilihan < 0.45:
+            self.ukur("GET /data_produksi", 'GET', f"/data_produksi?tanggal={tanggal}&periode={periode}")
+        elif pilihan < 0.9:
+            self.ukur("GET /api/data_laporan", 'GET', f"/api/data_laporan?tanggal={tanggal}&periode={periode}")
+        else:
+            self.ukur("GET /data_produksi (csv per hari)", 'GET',
+                      f"/data_produksi?tanggal={tanggal}&periode={periode}&download=csv&per=hari")
+
+
+def jalankan(app, kasir=4, esp32=2, owner=1, durasi=30, jeda=0.0, seed=42, url=None,
+             jumlah_roti=12, akun_kasir=3, tanggal=None, jumlah_outlet=1):
+    """Jalankan beban selama `durasi` detik, kembalikan {endpoint: ringkasan}.
+
+    `app` dipakai untuk test client; boleh None jika `url` diberikan.
+    """
+    if tanggal is None:
+        from app import waktu_wib
+        tanggal = waktu_wib().date()
+    # run membuat idempotency_key berbeda antar jalannya beban
+    opsi = {"jumlah_roti": jumlah_roti, "jumlah_outlet": jumlah_outlet, "tanggal": tanggal, "run": f"{time.time_ns():x}"}
+    berhenti = threading.Event()
+
+    def klien():
+        return KlienHttp(url) if url else KlienLokal(app)
+
+    pengguna = []
+    for i in range(kasir):
+        pengguna.append(Kasir(i % akun_kasir + 1, klien(), random.Random(seed + len(pengguna)), berhenti, jeda, opsi))
+    for _ in range(esp32):
+        pengguna.append(Esp32(klien(), random.Random(seed + len(pengguna)), berhenti, jeda, opsi))
+    for _ in range(owner):
+        pengguna.append(Owner(klien(), random.Random(seed + len(pengguna)), berhenti, jeda, opsi))
+
+    mulai = time.perf_counter()
+    for p in pengguna:
+        p.start()
+    berhenti.wait(durasi)
+    berhenti.set()
+    for p in pengguna:
+        p.join()
+    lama = time.perf_counter() - mulai
+
+    latensi, error = {}, {}
+    for p in pengguna:
+        for label, nilai in p.latensi.items():
+            latensi.setdefault(label, []).extend(nilai)
+        for label, n in p.error.items():
+            error[label] = error.get(label, 0) + n
+
+    hasil = {label: ringkas(nilai, lama, error.get(label, 0)) for label, nilai in sorted(latensi.items())}
+    semua = [x for label, nilai in latensi.items() if label != "POST /login" for x in nilai]
+    hasil["TOTAL"] = ringkas(semua, lama, sum(n for label, n in error.items() if label != "POST /login"))
+    return hasil
@@ -0,0 +1,73 @@
+"""Checkout per ukuran keranjang: round trip ke database dan latensi POST /simpan_transaksi.
+
+Setiap ukuran keranjang dikirim `ulang` kali lewat test client oleh kasir1,
+dengan roti 1..N bergiliran (isi-data --roti 50 supaya 50 item semuanya
+berbeda). Statement dan commit dihitung dengan listener Engine per thread,
+jadi yang terhitung hanya milik request checkout. Pekerja outbox dimatikan
+selama pengukuran; event yang terkumpul diproses di akhir supaya ledger tetap
+lengkap.
+"""
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import db, pastikan_outbox, OutboxLedger, User
+from benchmark.statistik import ringkas
+
+_hitung = threading.local()
+
+
+def _statement(conn, cursor, statement, parameters, context, executemany):
+    _hitung.query = getattr(_hitung, 'query', 0) + 1
+
+
+def _commit(conn):
+    _hitung.commit = getattr(_hitung, 'commit', 0) + 1
+
+
+def jalankan(app, daftar_item=(1, 10, 50), ulang=200, jumlah_roti=12):
+    """Kembalikan {"keranjang N item": ringkasan + query/round_trip rata-rata per checkout}."""
+    app.config['OUTBOX_PEKERJA'] = False
+    with app.app_context():
+        kasir = db.session.execute(db.select(User).where(User.Username == 'kasir1')).scalar()
+        if kasir is None:
+            raise SystemExit("akun kasir1 tidak ada; jalankan isi-data dulu")
+        idUser, idOutlet = kasir.idUser, kasir.idOutlet
+
+    klien = app.test_client()
+    with klien.session_transaction() as s:
+        s['role'] = 'Kasir'
+        s['username'] = 'kasir1'
+        s['user_id'] = idUser
+        s['idOutlet'] = idOutlet
+
+    event.listen(Engine, 'after_cursor_execute', _statement)
+    event.listen(Engine, 'commit', _commit)
+    hasil = {}
+    try:
+        for jumlah in daftar_item:
+            items = [{"idRoti": i % jumlah_roti + 1, "qty": 1} for i in range(jumlah)]
+            body = {"total": 0, "bayar": 0, "kembalian": 0, "items": items}
+            latensi, query, commit, error = [], 0, 0, 0
+            for _ in range(ulang):
+                _hitung.query = _hitung.commit = 0
+                mulai = time.perf_counter()
+                r = klien.post('/simpan_transaksi', json=body)
+                r.get_data()
+                latensi.append(time.perf_counter() - mulai)
+                query += _hitung.query
+                commit += _hitung.commit
+                error += r.status_code != 200
+            hasil[f"keranjang {jumlah} item"] = dict(ringkas(latensi, error=error), query=query / ulang,
+                                                     round_trip=(query + commit) / ulang)
+    finally:
+        event.remove(Engine, 'after_cursor_execute', _statement)
+        event.remove(Engine, 'commit', _commit)
+
+    with app.app_context():
+        terakhir = db.session.execute(db.select(db.func.max(OutboxLedger.idOutbox))).scalar()
+        if terakhir is not None:
+            pastikan_outbox(terakhir)
+    return hasil
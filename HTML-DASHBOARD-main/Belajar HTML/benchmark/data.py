@@ -0,0 +1,215 @@
+"""Generator data bakery sintetis yang deterministik.
+
+Ledger (produksi, transaksi, detail, ringkasan_baru) dibuat di memori hari
+demi hari dengan stok berjalan per outlet per roti, lalu ditulis dengan bulk
+insert. Outlet ke-n lebih sepi dari outlet pertama; kasir dibagi rata ke
+semua outlet.
+stok_harian dan stok_roti dibangun ulang dari ledger lewat
+bangun_ulang_stok_harian(), jadi hasilnya sama dengan data yang ditulis app.
+"""
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app import (db, waktu_wib, bangun_ulang_stok_harian, Outlet, User, JenisRoti,
+                 ProduksiHarian, TransaksiPenjualan, DetailTransaksi, RingkasanBaru)
+
+ROTI = [
+    ('Roti Tawar', 15000), ('Roti Coklat', 6000), ('Roti Keju', 7000),
+    ('Roti Sobek', 18000), ('Donat Gula', 4000), ('Roti Pisang', 6000),
+    ('Roti Kelapa', 5000), ('Croissant', 12000), ('Roti Abon', 8000),
+    ('Bolu Pandan', 25000), ('Roti Sosis', 9000), ('Roti Srikaya', 6000),
+    ('Kue Sus', 3500), ('Roti Kismis', 7000), ('Brownies', 30000),
+    ('Roti Maryam', 10000),
+]
+
+# Senin .. Minggu
+FAKTOR_HARI = (1.0, 0.95, 1.0, 1.0, 1.1, 1.35, 1.25)
+JUMLAH_ITEM = ((1, 2, 3, 4), (50, 30, 15, 5))
+JUMLAH_QTY = ((1, 2, 3), (60, 30, 10))
+PECAHAN = (2000, 5000, 10000, 20000, 50000, 100000)
+ISI_LOYANG = 12
+ID_OWNER = 1
+
+# Baris ledger ditulis setiap sekian hari supaya memori tetap kecil
+HARI_PER_TULIS = 31
+
+
+def hapus_semua():
+    """Kosongkan semua tabel app (urutan kebalikan foreign key)."""
+    for tabel in reversed(db.metadata.sorted_tables):
+        db.session.execute(tabel.delete())
+    db.session.commit()
+
+
+def _pilih_item(rng, ids, bobot):
+    k = rng.choices(*JUMLAH_ITEM)[0]
+    terpilih = []
+    while len(terpilih) < min(k, len(ids)):
+        idRoti = rng.choices(ids, bobot)[0]
+        if idRoti not in terpilih:
+            terpilih.append(idRoti)
+    return [(idRoti, rng.choices(*JUMLAH_QTY)[0]) for idRoti in terpilih]
+
+
+def _uang_diterima(rng, total):
+    # Pembeli membayar pas, atau dengan pecahan terkecil yang cukup
+    if rng.random() < 0.3:
+        return total
+    for pecahan in PECAHAN:
+        if pecahan >= total:
+            return pecahan
+    return math.ceil(total / 100000) * 100000
+
+
+def isi_data(app, hari=365, seed=42, jumlah_roti=12, jumlah_kasir=3, transaksi_per_hari=120,
+             sampai=None, hapus=False, jumlah_outlet=1):
+    """Isi database dengan `hari` hari data sampai tanggal `sampai` (default hari ini).
+
+    `transaksi_per_hari` berlaku untuk outlet pertama; jumlah kasir minimal satu per outlet.
+    """
+    rng = random.Random(seed)
+    sampai = sampai or waktu_wib().date()
+    mulai = sampai - timedelta(days=hari - 1)
+
+    with app.app_context():
+        db.create_all()
+        if db.session.execute(db.select(db.func.count()).select_from(JenisRoti)).scalar():
+            if not hapus:
+                raise SystemExit("Database sudah berisi data; pakai --hapus untuk mengosongkannya")
+            hapus_semua()
+
+        awal = time.perf_counter()
+        outlet = [{"idOutlet": o, "Nama_Outlet": "Outlet Utama" if o == 1 else f"Outlet {o}"}
+                  for o in range(1, jumlah_outlet + 1)]
+        users = [{"idUser": ID_OWNER, "Username": "owner", "Password": "owner", "Role": "Owner",
+                  "Nama": "Owner", "idOutlet": None}]
+        kasir_ids = {o["idOutlet"]: [] for o in outlet}
+        for i in range(1, max(jumlah_kasir, jumlah_outlet) + 1):
+            idOutlet = (i - 1) % jumlah_outlet + 1
+            users.append({"idUser": ID_OWNER + i, "Username": f"kasir{i}", "Password": f"kasir{i}",
+                          "Role": "Kasir", "Nama": f"Kasir {i}", "idOutlet": idOutlet})
+            kasir_ids[idOutlet].append(ID_OWNER + i)
+
+        roti = []
+        for i in range(jumlah_roti):
+            nama, harga = ROTI[i] if i < len(ROTI) else (f"Roti Varian {i + 1}", 5000 + 500 * (i % 10))
+            roti.append({"idRoti": i + 1, "Nama_Roti": nama, "Harga": harga})
+        ids = [r["idRoti"] for r in roti]
+        harga = {r["idRoti"]: r["Harga"] for r in roti}
+        bobot = [1 / (i + 1) ** 0.8 for i in range(jumlah_roti)]
+        rng.shuffle(bobot)
+        bagian = {idRoti: b / sum(bobot) for idRoti, b in zip(ids, bobot)}
+
+        db.session.execute(insert(Outlet), outlet)
+        db.session.execute(insert(User), users)
+        db.session.execute(insert(JenisRoti), roti)
+        db.session.commit()
+
+        # Rata-rata roti per transaksi, untuk rencana produksi
+        rata_item = sum(k * w for k, w in zip(*JUMLAH_ITEM)) / sum(JUMLAH_ITEM[1])
+        rata_qty = sum(q * w for q, w in zip(*JUMLAH_QTY)) / sum(JUMLAH_QTY[1])
+
+        stok = {(idOutlet, idRoti): 0 for idOutlet in kasir_ids for idRoti in ids}
+        produksi_terakhir = {}
+        id_produksi = id_transaksi = id_detail = id_ringkasan = 0
+        rows = {ProduksiHarian: [], TransaksiPenjualan: [], DetailTransaksi: [], RingkasanBaru: []}
+        jumlah = {model: 0 for model in rows}
+
+        def tulis():
+            for model, baris in rows.items():
+                if baris:
+                    db.session.execute(insert(model), baris)
+                    jumlah[model] += len(baris)
+                    baris.clear()
+            db.session.commit()
+
+        for d in range(hari):
+            tanggal = mulai + timedelta(days=d)
+            hari_ke = tanggal.timetuple().tm_yday
+            faktor = (FAKTOR_HARI[tanggal.weekday()]
+                      * (1 + 0.15 * math.sin(2 * math.pi * hari_ke / 365))
+                      * (1 + 0.1 * d / hari))
+            tengah_malam = datetime(tanggal.year, tanggal.month, tanggal.day)
+
+            for idOutlet, kasir in kasir_ids.items():
+                rata = transaksi_per_hari * faktor / (1 + 0.25 * (idOutlet - 1))
+                n_transaksi = max(0, round(rng.gauss(rata, rata * 0.1)))
+
+                # Produksi (satu atau dua batch) menutup perkiraan permintaan hari itu
+                kejadian = []
+                for idRoti in ids:
+                    target = rata * rata_item * rata_qty * bagian[idRoti] * 1.15
+                    kurang = target - stok[(idOutlet, idRoti)]
+                    if kurang <= 0:
+                        continue
+                    total = math.ceil(kurang / ISI_LOYANG) * ISI_LOYANG
+                    batch = [total] if total <= 4 * ISI_LOYANG else [total // 2, total - total // 2]
+                    for i, qty in enumerate(batch):
+                        detik = rng.randint(5 * 3600 + 1800, 9 * 3600) if i == 0 else rng.randint(12 * 3600, 14 * 3600)
+                        kejadian.append((tengah_malam + timedelta(seconds=detik), 'produksi', (idRoti, qty)))
+                for _ in range(n_transaksi):
+                    detik = rng.randint(7 * 3600, 21 * 3600)
+                    kejadian.append((tengah_malam + timedelta(seconds=detik), 'transaksi',
+                                     (rng.choice(kasir), _pilih_item(rng, ids, bobot))))
+                kejadian.sort(key=lambda k: (k[0], k[1]))
+
+                for waktu, jenis, isi in kejadian:
+                    if jenis == 'produksi':
+                        idRoti, qty = isi
+                        kunci = (idOutlet, idRoti)
+                        id_produksi += 1
+                        id_ringkasan += 1
+                        stok[kunci] += qty
+                        produksi_terakhir[kunci] = id_produksi
+                        rows[ProduksiHarian].append({
+                            "idProduksi": id_produksi, "idRoti": idRoti, "idUser": ID_OWNER, "idOutlet": idOutlet,
+                            "Jumlah_Produksi": qty, "Tanggal_Produksi": waktu})
+                        rows[RingkasanBaru].append({
+                            "idRingkasan": id_ringkasan, "idUser": ID_OWNER, "idOutlet": idOutlet,
+                            "idProduksi": id_produksi, "idTransaksi_Penjualan": None, "Tanggal": waktu,
+                            "Total_Produksi": qty, "Total_Terjual": 0, "Stok_Aktual": stok[kunci],
+                            "Total_Uang_Masuk": 0})
+                        continue
+
+                    idUser, items = isi
+                    # Roti yang habis tidak bisa dibeli
+                    items = [(idRoti, min(qty, stok[(idOutlet, idRoti)])) for idRoti, qty in items
+                             if stok[(idOutlet, idRoti)] > 0]
+                    if not items:
+                        continue
+                    id_transaksi += 1
+                    total = sum(harga[idRoti] * qty for idRoti, qty in items)
+                    bayar = _uang_diterima(rng, total)
+                    rows[TransaksiPenjualan].append({
+                        "idTransaksi_Penjualan": id_transaksi, "idUser": idUser, "idOutlet": idOutlet,
+                        "Tanggal_Transaksi": waktu, "Total_Harga": total, "Uang_Diterima": bayar,
+                        "Kembalian": bayar - total})
+                    for idRoti, qty in items:
+                        kunci = (idOutlet, idRoti)
+                        id_detail += 1
+                        id_ringkasan += 1
+                        stok[kunci] -= qty
+                        subtotal = harga[idRoti] * qty
+                        rows[DetailTransaksi].append({
+                            "idDetail_Transaksi": id_detail, "id_transaksi": id_transaksi,
+                            "id_roti": idRoti, "Jumlah": qty, "SubTotal": subtotal})
+                        rows[RingkasanBaru].append({
+                            "idRingkasan": id_ringkasan, "idUser": idUser, "idOutlet": idOutlet,
+                            "idProduksi": produksi_terakhir[kunci], "idTransaksi_Penjualan": id_transaksi,
+                            "Tanggal": waktu, "Total_Produksi": 0, "Total_Terjual": qty,
+                            "Stok_Aktual": stok[kunci], "Total_Uang_Masuk": subtotal})
+
+            if (d + 1) % HARI_PER_TULIS == 0:
+                tulis()
+        tulis()
+
+        jumlah_harian = bangun_ulang_stok_harian()
+        print(f"{hari} hari ({mulai} s/d {sampai}), seed {seed}, {time.perf_counter() - awal:.1f} detik")
+        print(f"  outlet {len(outlet)}, roti {len(roti)}, user {len(users)}")
+        for model, n in jumlah.items():
+            print(f"  {model.__tablename__} {n}")
+        print(f"  stok_harian {jumlah_harian}")
@@ -0,0 +1,221 @@
+"""Ekspor /data_produksi?per=hari: waktu byte pertama, waktu total dan RSS puncak.
+
+Database --db diisi sendiri dengan baris stok_harian sintetis (OUTLET outlet x
+ROTI roti x N hari), tanpa ledger; ekspor per hari hanya membaca stok_harian.
+Setiap jumlah baris diekspor sebagai owner untuk semua outlet, dengan
+periode yang mencakup tepat sekian baris.
+
+Setiap kasus dijalankan di proses Python baru, jadi RSS puncak (VmHWM)
+milik satu ekspor saja dan openpyxl belum dimuat:
+
+- csv / ndjson : generator dengan cursor server-side; byte pertama terkirim
+                 sebelum query selesai dibaca.
+- excel        : workbook write-only ke file sementara lalu send_file. Tidak
+                 di-stream: byte pertama baru terkirim setelah seluruh
+                 workbook selesai, jadi ttfb_ms ~ total_ms. RAM tetap kecil.
+                 EKSPOR_EXCEL_MAKS dimatikan di proses anak supaya rentang
+                 di atas batas itu tetap bisa diukur.
+- excel lama   : jalur sebelum write-only (fetchall, Workbook biasa, loop
+                 border & lebar kolom, BytesIO) pada baris yang sama, untuk
+                 pembanding. Seluruh sel ada di memori.
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from app import db, waktu_wib, JenisRoti, Outlet, StokHarian, User
+from benchmark import data
+
+OUTLET = 20
+ROTI = 50
+BARIS_PER_HARI = OUTLET * ROTI
+BARIS_PER_TULIS = 50000
+FORMAT = ("csv", "ndjson", "excel", "excel lama")
+FOLDER_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def isi(app, hari, seed=42, hapus=False):
+    """Isi stok_harian dengan `hari` hari sampai hari ini; kembalikan tanggal terakhir.
+
+    Data ekspor dari jalannya sebelumnya dipakai lagi jika sudah cukup hari.
+    """
+    akhir = waktu_wib().date()
+    mulai = akhir - timedelta(days=hari - 1)
+    with app.app_context():
+        db.create_all()
+        baris = db.session.execute(db.select(db.func.count()).select_from(StokHarian)).scalar()
+        outlet = db.session.execute(db.select(db.func.count()).select_from(Outlet)).scalar()
+        roti = db.session.execute(db.select(db.func.count()).select_from(JenisRoti)).scalar()
+        terakhir = db.session.execute(db.select(db.func.max(StokHarian.Tanggal))).scalar()
+        if (outlet, roti) == (OUTLET, ROTI) and baris and baris % BARIS_PER_HARI == 0 \
+                and baris >= hari * BARIS_PER_HARI:
+            return date.fromisoformat(str(terakhir))
+        if db.session.execute(db.select(db.func.count()).select_from(JenisRoti)).scalar():
+            if not hapus:
+                raise SystemExit("Database sudah berisi data lain; pakai --hapus untuk mengosongkannya")
+            data.hapus_semua()
+
+        awal = time.perf_counter()
+        rng = random.Random(seed)
+        db.session.execute(insert(Outlet), [{"idOutlet": o, "Nama_Outlet": f"Outlet {o}"}
+                                            for o in range(1, OUTLET + 1)])
+        db.session.execute(insert(User), [{"idUser": data.ID_OWNER, "Username": "owner", "Password": "owner",
+                                           "Role": "Owner", "Nama": "Owner", "idOutlet": None}])
+        db.session.execute(insert(JenisRoti), [
+            {"idRoti": i + 1, "Nama_Roti": data.ROTI[i][0] if i < len(data.ROTI) else f"Roti Varian {i + 1}",
+             "Harga": 5000 + 500 * (i % 10)} for i in range(ROTI)])
+
+        rows = []
+        for d in range(hari):
+            tanggal = mulai + timedelta(days=d)
+            terakhir = datetime(tanggal.year, tanggal.month, tanggal.day, 21)
+            for idOutlet in range(1, OUTLET + 1):
+                for idRoti in range(1, ROTI + 1):
+                    produksi = rng.randint(0, 8) * data.ISI_LOYANG
+                    terjual = rng.randint(0, produksi)
+                    rows.append({"idOutlet": idOutlet, "idRoti": idRoti, "Tanggal": tanggal,
+                                 "Total_Produksi": produksi, "Total_Terjual": terjual,
+                                 "Total_Uang_Masuk": terjual * 6000, "Stok_Akhir": produksi - terjual,
+                                 "Tanggal_Terakhir": terakhir})
+            if len(rows) >= BARIS_PER_TULIS:
+                db.session.execute(insert(StokHarian), rows)
+                rows.clear()
+        if rows:
+            db.session.execute(insert(StokHarian), rows)
+        db.session.commit()
+        print(f"{hari * BARIS_PER_HARI} baris stok_harian ditulis dalam {time.perf_counter() - awal:.1f} detik",
+              flush=True)
+    return akhir
+
+
+def excel_lama():
+    """Route pembanding: ekspor Excel sebelum workbook write-only, untuk baris per hari."""
+    from flask import request, send_file
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    import io
+    from app import KOLOM_EKSPOR, KOLOM_OUTLET, KOLOM_TANGGAL, QUERY_PRODUKSI_PER_HARI, daftar_outlet, rentang_tanggal
+
+    mulai, akhir = rentang_tanggal(request.args['tanggal'], request.args['periode'])
+    data_baris = db.session.execute(QUERY_PRODUKSI_PER_HARI, {
+        "outlet": [o for o, _ in daftar_outlet()], "mulai": mulai, "akhir": akhir}).fetchall()
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data Produksi"
+    ws.append([f"Tanggal: {request.args['tanggal']}"])
+    ws.append([f"Periode: {request.args['periode']} hari"])
+    ws.append([])
+    ws.append([judul for judul, _, _ in [KOLOM_TANGGAL, KOLOM_OUTLET] + KOLOM_EKSPOR])
+
+    header_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+    for cell in ws[4]:
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal='center')
+        cell.fill = header_fill
+        cell.border = thin_border
+
+    for row in data_baris:
+        ws.append(list(row))
+
+    for row_cells in ws.iter_rows(min_row=4, max_row=ws.max_row, min_col=1, max_col=7):
+        for cell in row_cells:
+            cell.border = thin_border
+
+    for column_cells in ws.columns:
+        length = max(len(str(cell.value)) if cell.value else 0 for cell in column_cells)
+        ws.column_dimensions[column_cells[0].column_letter].width = length + 2
+
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+    return send_file(output, download_name="data_produksi_lama.xlsx", as_attachment=True,
+                     mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+
+
+def _rss_puncak():
+    """RSS puncak proses ini dalam KiB.
+
+    VmHWM dari /proc; ru_maxrss di Linux membawa puncak proses induk melewati exec.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for baris in f:
+                if baris.startswith('VmHWM:'):
+                    return int(baris.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _ukur(path):
+    """Dijalankan di proses anak: satu GET sebagai owner, dibaca potong demi potong."""
+    from app import create_app
+    app = create_app()
+    app.add_url_rule('/ekspor_lama', view_func=excel_lama)
+    klien = app.test_client()
+    with klien.session_transaction() as s:
+        s['role'] = 'Owner'
+        s['username'] = 'owner'
+
+    rss_awal = _rss_puncak()
+    mulai = time.perf_counter()
+    r = klien.get(path, buffered=False)
+    ttfb, ukuran = None, 0
+    for potong in r.response:
+        if potong and ttfb is None:
+            ttfb = time.perf_counter() - mulai
+        ukuran += len(potong)
+    total = time.perf_counter() - mulai
+    r.close()
+    rss = _rss_puncak()
+    return {"status": r.status_code, "ttfb": ttfb or total, "total": total, "byte": ukuran,
+            "rss_awal": rss_awal, "rss": rss}
+
+
+def jalankan(app, daftar_baris=(10000, 1000000), daftar_format=FORMAT, seed=42, hapus=False):
+    """Kembalikan {"N baris format": ukuran, waktu byte pertama, waktu total, RSS puncak}."""
+    for baris in daftar_baris:
+        if baris % BARIS_PER_HARI:
+            raise SystemExit(f"--baris harus kelipatan {BARIS_PER_HARI} ({OUTLET} outlet x {ROTI} roti)")
+    tanggal = isi(app, max(daftar_baris) // BARIS_PER_HARI, seed=seed, hapus=hapus)
+
+    hasil = {}
+    for baris in daftar_baris:
+        query = f"tanggal={tanggal}&periode={baris // BARIS_PER_HARI - 1}"
+        for nama in daftar_format:
+            if nama == "excel lama":
+                path = f"/ekspor_lama?{query}"
+            else:
+                path = f"/data_produksi?{query}&per=hari&download={nama}"
+            keluaran = subprocess.run([sys.executable, "-m", "benchmark.ekspor", path], cwd=FOLDER_APP,
+                                      env=dict(os.environ, FLASK_EKSPOR_EXCEL_MAKS="null"),
+                                      capture_output=True, text=True)
+            label = f"{baris} baris {nama}"
+            if keluaran.returncode != 0:
+                # Mis. dibunuh OOM killer (returncode -9) pada jalur lama
+                print(f"{label}: proses gagal (kode {keluaran.returncode})\n{keluaran.stderr[-2000:]}", flush=True)
+                hasil[label] = {"baris": baris, "error": 1}
+                continue
+            r = json.loads(keluaran.stdout.strip().splitlines()[-1])
+            if r["status"] != 200:
+                raise SystemExit(f"{path}: status {r['status']}")
+            hasil[label] = {"baris": baris, "error": 0, "ukuran_mb": r["byte"] / 2 ** 20,
+                            "ttfb_ms": r["ttfb"] * 1000, "total_ms": r["total"] * 1000,
+                            "rss_mb": r["rss"] / 1024, "naik_mb": (r["rss"] - r["rss_awal"]) / 1024}
+            print(f"{label}: byte pertama {hasil[label]['ttfb_ms']:.0f} ms, "
+                  f"RSS puncak {hasil[label]['rss_mb']:.0f} MB", flush=True)
+    return hasil
+
+
+if __name__ == "__main__":
+    print(json.dumps(_ukur(sys.argv[1])))
@@ -0,0 +1,114 @@
+"""Microbenchmark query laporan: langsung ke database dan lewat route Flask.
+
+Tanggal acuan default adalah tanggal terakhir di stok_harian, jadi hasil
+dari data isi-data yang sama bisa dibandingkan antar rilis. Query SQL langsung
+membaca outlet utama; kasus "semua outlet" membandingkan query per outlet yang
+dijalankan bersamaan (per_outlet) dengan satu per satu.
+"""
+import time
+from datetime import date
+
+from app import (db, cache_laporan, waktu_wib, rentang_tanggal, hitung_data_laporan, daftar_outlet,
+                 per_outlet, ID_OUTLET_UTAMA, QUERY_PRODUKSI, QUERY_LAPORAN, StokHarian)
+from benchmark.statistik import ringkas
+
+PERIODE = ('none', '7', '30', '90')
+
+
+def _ukur(fungsi, ulang, pemanasan=3):
+    for _ in range(pemanasan):
+        fungsi()
+    latensi = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        latensi.append(time.perf_counter() - mulai)
+    return latensi
+
+
+def _kasus(tanggal, hari_ini):
+    """Daftar (nama, fungsi) yang diukur; fungsi dijalankan di dalam app context."""
+    kasus = []
+    outlet = [o.idOutlet for o in daftar_outlet()]
+    for periode in PERIODE:
+        mulai, akhir = rentang_tanggal(tanggal, periode)
+        params = {"idOutlet": ID_OUTLET_UTAMA, "mulai": mulai, "akhir": akhir}
+        kasus.append((f"sql QUERY_PRODUKSI periode={periode}",
+                      lambda params=params: db.session.execute(QUERY_PRODUKSI, params).fetchall()))
+        kasus.append((f"sql QUERY_LAPORAN periode={periode}",
+                      lambda params=params: db.session.execute(QUERY_LAPORAN, params).fetchall()))
+        kasus.append((f"hitung_data_laporan periode={periode}",
+                      lambda mulai=mulai, akhir=akhir: hitung_data_laporan(mulai, akhir)))
+
+        def per_satu(idOutlet, mulai=mulai, akhir=akhir):
+            return db.session.execute(
+                QUERY_PRODUKSI, {"idOutlet": idOutlet, "mulai": mulai, "akhir": akhir}).fetchall()
+        kasus.append((f"QUERY_PRODUKSI {len(outlet)} outlet paralel periode={periode}",
+                      lambda per_satu=per_satu: per_outlet(per_satu, outlet)))
+        kasus.append((f"QUERY_PRODUKSI {len(outlet)} outlet serial periode={periode}",
+                      lambda per_satu=per_satu: [per_satu(o) for o in outlet]))
+
+    # data_produksi_kasir selalu membaca hari ini
+    mulai, akhir = rentang_tanggal(hari_ini)
+    kasus.append(("sql QUERY_PRODUKSI kasir hari ini",
+                  lambda: db.session.execute(QUERY_PRODUKSI, {"idOutlet": ID_OUTLET_UTAMA, "mulai": mulai,
+                                                              "akhir": akhir}).fetchall()))
+    return kasus
+
+
+def _route(tanggal):
+    """Daftar (nama, role, url) untuk diukur lewat test client."""
+    route = []
+    for periode in PERIODE:
+        route.append((f"GET /data_produksi periode={periode}", 'Owner',
+                      f"/data_produksi?tanggal={tanggal}&periode={periode}"))
+        route.append((f"GET /api/data_laporan periode={periode}", 'Owner',
+                      f"/api/data_laporan?tanggal={tanggal}&periode={periode}"))
+        route.append((f"GET /api/data_laporan versi=2 periode={periode}", 'Owner',
+                      f"/api/data_laporan?tanggal={tanggal}&periode={periode}&versi=2"))
+    route.append(("GET /data_produksi_kasir", 'Kasir', "/data_produksi_kasir"))
+    route.append(("GET /data_produksi excel per=hari periode=30", 'Owner',
+                  f"/data_produksi?tanggal={tanggal}&periode=30&download=excel&per=hari"))
+    route.append(("GET /data_produksi csv per=hari periode=90", 'Owner',
+                  f"/data_produksi?tanggal={tanggal}&periode=90&download=csv&per=hari"))
+    return route
+
+
+def jalankan(app, ulang=50, tanggal=None):
+    """Jalankan semua kasus, kembalikan (tanggal acuan, {nama: ringkasan latensi})."""
+    hasil = {}
+    with app.app_context():
+        if tanggal is None:
+            terakhir = db.session.execute(db.select(db.func.max(StokHarian.Tanggal))).scalar()
+            if terakhir is None:
+                raise SystemExit("stok_harian kosong; jalankan isi-data dulu")
+            tanggal = terakhir if isinstance(terakhir, date) else date.fromisoformat(str(terakhir))
+        tanggal = tanggal.isoformat()
+        hari_ini = waktu_wib().date().isoformat()
+
+        for nama, fungsi in _kasus(tanggal, hari_ini):
+            hasil[nama] = ringkas(_ukur(fungsi, ulang))
+            db.session.rollback()
+
+    klien = {}
+    for role, username in (('Owner', 'owner'), ('Kasir', 'kasir1')):
+        klien[role] = app.test_client()
+        with klien[role].session_transaction() as s:
+            s['role'] = role
+            s['username'] = username
+
+    for nama, role, url in _route(tanggal):
+        def minta(url=url, c=klien[role]):
+            r = c.get(url)
+            r.get_data()
+            if r.status_code != 200:
+                raise RuntimeError(f"{url}: status {r.status_code}")
+
+        # Dingin: cache laporan dikosongkan setiap kali; hangat: cache dipakai
+        def dingin(minta=minta):
+            cache_laporan.invalidasi(date.min)
+            minta()
+        hasil[nama + " (dingin)"] = ringkas(_ukur(dingin, ulang))
+        if 'download' not in url:
+            hasil[nama + " (hangat)"] = ringkas(_ukur(minta, ulang))
+    return tanggal, hasil
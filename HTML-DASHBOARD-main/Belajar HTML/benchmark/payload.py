@@ -0,0 +1,64 @@
+"""Ukuran dan waktu parse /api/data_laporan: format v1 dibanding v2 kolumnar.
+
+Setiap kasus diminta lewat test client sebagai owner (semua outlet) tanpa
+kompresi, dengan gzip dan dengan br (jika modul brotli terpasang), lalu body
+tanpa kompresi di-parse `ulang` kali dengan json.loads sebagai pendekatan
+JSON.parse di browser. Cache laporan dipakai, jadi yang diukur hanya
+payload, bukan query.
+"""
+import json
+import time
+from datetime import date
+
+from app import brotli, db, StokHarian
+from benchmark.statistik import ringkas
+
+PERIODE = ('none', '7', '30', '90')
+
+
+def _kasus(tanggal):
+    kasus = []
+    for periode in PERIODE:
+        url = f"/api/data_laporan?tanggal={tanggal}&periode={periode}"
+        kasus.append((f"v1 periode={periode}", url))
+        kasus.append((f"v2 periode={periode}", url + "&versi=2"))
+    # periode 90 dengan bucket=auto dikirim per minggu; bandingkan dengan per hari
+    kasus.append(("v2 periode=90 bucket=hari", f"/api/data_laporan?tanggal={tanggal}&periode=90&versi=2&bucket=hari"))
+    return kasus
+
+
+def jalankan(app, ulang=200, tanggal=None):
+    """Kembalikan (tanggal acuan, {kasus: ukuran byte + ringkasan waktu parse})."""
+    if tanggal is None:
+        with app.app_context():
+            terakhir = db.session.execute(db.select(db.func.max(StokHarian.Tanggal))).scalar()
+        if terakhir is None:
+            raise SystemExit("stok_harian kosong; jalankan isi-data dulu")
+        tanggal = terakhir if isinstance(terakhir, date) else date.fromisoformat(str(terakhir))
+    tanggal = tanggal.isoformat()
+
+    klien = app.test_client()
+    with klien.session_transaction() as s:
+        s['role'] = 'Owner'
+        s['username'] = 'owner'
+
+    encoding = ['identity', 'gzip'] + (['br'] if brotli is not None else [])
+    hasil = {}
+    for nama, url in _kasus(tanggal):
+        ukuran = {}
+        for enc in encoding:
+            r = klien.get(url, headers={"Accept-Encoding": enc})
+            if r.status_code != 200:
+                raise SystemExit(f"{url}: status {r.status_code}")
+            ukuran[enc] = len(r.get_data())
+            if enc == 'identity':
+                body = r.get_data(as_text=True)
+
+        latensi = []
+        for _ in range(ulang):
+            mulai = time.perf_counter()
+            json.loads(body)
+            latensi.append(time.perf_counter() - mulai)
+        hasil[nama] = dict(ringkas(latensi), byte=ukuran['identity'], gzip_byte=ukuran['gzip'],
+                           br_byte=ukuran.get('br', 0))
+    return tanggal, hasil
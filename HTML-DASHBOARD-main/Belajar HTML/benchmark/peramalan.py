@@ -0,0 +1,82 @@
+"""Peramalan produksi: versi NumPy di app.py dibanding loop per roti.
+
+Keduanya membaca outlet utama. Versi naif membaca riwayat setiap roti dengan
+query sendiri dan menghitung
+rata-rata hari yang sama, simpangan dan laju sisa dengan loop Python. Hasil
+keduanya dicek sama sebelum waktunya dibandingkan.
+"""
+import statistics
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import text
+
+from app import db, hitung_peramalan, ID_OUTLET_UTAMA, JenisRoti, StokHarian
+from benchmark.statistik import ringkas
+
+
+def peramalan_naif(daftar_idRoti, mulai, akhir, target):
+    minggu = (akhir - mulai).days // 7
+    hari_ke = (target - mulai).days % 7
+    bobot = list(range(1, minggu + 1))
+    hasil = {"ids": [], "ramalan": [], "simpangan": [], "sisa": []}
+
+    for idRoti in sorted(daftar_idRoti):
+        rows = db.session.execute(text("""
+            SELECT Tanggal, Total_Produksi, Total_Terjual, Stok_Akhir
+            FROM stok_harian
+            WHERE idOutlet = :idOutlet AND idRoti = :idRoti AND Tanggal >= :mulai AND Tanggal < :akhir
+        """), {"idOutlet": ID_OUTLET_UTAMA, "idRoti": idRoti, "mulai": mulai, "akhir": akhir}).all()
+        per_hari = {date.fromisoformat(str(tgl)): (prod, jual, stok) for tgl, prod, jual, stok in rows}
+        stok = db.session.execute(text("""
+            SELECT Stok_Akhir FROM stok_harian
+            WHERE idOutlet = :idOutlet AND idRoti = :idRoti AND Tanggal < :mulai
+            ORDER BY Tanggal DESC LIMIT 1
+        """), {"idOutlet": ID_OUTLET_UTAMA, "idRoti": idRoti, "mulai": mulai}).scalar() or 0
+
+        hari_sama = []
+        tersedia = terjual = 0
+        for d in range((akhir - mulai).days):
+            prod, jual, stok_akhir = per_hari.get(mulai + timedelta(days=d), (0, 0, None))
+            tersedia += max(stok, 0) + prod
+            terjual += jual
+            if stok_akhir is not None:
+                stok = stok_akhir
+            if d % 7 == hari_ke:
+                hari_sama.append(jual)
+
+        hasil["ids"].append(idRoti)
+        hasil["ramalan"].append(sum(b * x for b, x in zip(bobot, hari_sama)) / sum(bobot))
+        hasil["simpangan"].append(statistics.stdev(hari_sama) if minggu > 1 else 0.0)
+        hasil["sisa"].append(min(max((tersedia - terjual) / tersedia, 0), 1) if tersedia else 0.0)
+    return hasil
+
+
+def jalankan(app, daftar_minggu=(8, 52, 156), ulang=5):
+    hasil = {}
+    with app.app_context():
+        ids = db.session.execute(db.select(JenisRoti.idRoti)).scalars().all()
+        terakhir = db.session.execute(db.select(db.func.max(StokHarian.Tanggal))).scalar()
+        if terakhir is None:
+            raise SystemExit("stok_harian kosong; jalankan isi-data dulu")
+        akhir = date.fromisoformat(str(terakhir)) + timedelta(days=1)
+        target = akhir + timedelta(days=1)
+
+        for minggu in daftar_minggu:
+            mulai = akhir - timedelta(days=7 * minggu)
+            vektor = hitung_peramalan(ids, mulai, akhir, target)
+            naif = peramalan_naif(ids, mulai, akhir, target)
+            for kunci in ("ids", "ramalan", "simpangan", "sisa"):
+                if not np.allclose(vektor[kunci], naif[kunci]):
+                    raise SystemExit(f"{minggu} minggu: hasil '{kunci}' berbeda antara NumPy dan loop")
+
+            for nama, fungsi in (("numpy", hitung_peramalan), ("loop per roti", peramalan_naif)):
+                latensi = []
+                for _ in range(ulang):
+                    mulai_ukur = time.perf_counter()
+                    fungsi(ids, mulai, akhir, target)
+                    latensi.append(time.perf_counter() - mulai_ukur)
+                hasil[f"{nama} {minggu} minggu"] = ringkas(latensi)
+            db.session.rollback()
+    return hasil
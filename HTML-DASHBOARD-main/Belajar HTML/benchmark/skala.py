@@ -0,0 +1,55 @@
+"""Throughput beban campuran terhadap jumlah worker gunicorn.
+
+Untuk setiap jumlah worker, gunicorn dijalankan dengan gunicorn.conf.py di
+port lokal, beban.jalankan() dikirim lewat HTTP, lalu server dihentikan
+dengan SIGTERM (graceful shutdown). Database dari --db / DATABASE_URL. Pakai
+MySQL lokal untuk hasil yang berarti: SQLite mengunci seluruh file saat
+menulis, jadi checkout antar worker saling menunggu. Load driver berjalan di
+satu proses Python, jadi beri mesin core lebih banyak dari worker terbesar.
+"""
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from benchmark import beban
+
+FOLDER_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _tunggu_siap(url, proses, batas_waktu=60):
+    batas = time.monotonic() + batas_waktu
+    while time.monotonic() < batas:
+        if proses.poll() is not None:
+            raise SystemExit(f"gunicorn berhenti dengan kode {proses.returncode}")
+        try:
+            with urllib.request.urlopen(url + "/login", timeout=5) as r:
+                if r.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"gunicorn tidak siap dalam {batas_waktu} detik")
+
+
+def jalankan(daftar_worker=(1, 2, 4), thread=8, port=5055, **opsi_beban):
+    """Kembalikan {"N worker <endpoint>": ringkasan} untuk setiap jumlah worker."""
+    url = f"http://127.0.0.1:{port}"
+    hasil = {}
+    for jumlah in daftar_worker:
+        env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(jumlah), FLASK_WEB_THREAD=str(thread))
+        proses = subprocess.Popen([sys.executable, "-m", "gunicorn", "--log-level", "warning"],
+                                  cwd=FOLDER_APP, env=env)
+        try:
+            _tunggu_siap(url, proses)
+            ringkasan = beban.jalankan(None, url=url, **opsi_beban)
+        finally:
+            proses.send_signal(signal.SIGTERM)
+            proses.wait(timeout=60)
+        for label, r in ringkasan.items():
+            hasil[f"{jumlah} worker {label}"] = r
+        print(f"{jumlah} worker x {thread} thread: {ringkasan['TOTAL']['per_detik']:.1f} request/detik", flush=True)
+    return hasil
@@ -0,0 +1,173 @@
+"""Dashboard SSE yang terbuka vs checkout dan query database.
+
+Untuk setiap jumlah penonton, N owner membuka /stream/stok dan membacanya
+terus, lalu kasir checkout selama `durasi` detik (beban.Kasir). Yang dicatat:
+stream yang tersambung / ditolak (event: penuh), event stok per penonton,
+latensi checkout, request kasir yang gagal, dan query database dari
+db_query_total di /metrics (semua statement proses itu, termasuk pekerja
+outbox dan pengamat siaran).
+Query per checkout harus kira-kira sama berapa pun penontonnya: delta dibaca
+sekali per proses dari siaran_ledger, bukan per stream.
+
+Tanpa --url / --gunicorn, test client di proses ini dengan SSE_MAKS dinaikkan
+supaya semua stream diterima. Dengan --gunicorn, server gthread dijalankan
+seperti `skala` dan SSE_MAKS mengikuti --sse-maks / default app, jadi stream
+yang memegang thread dan checkout yang antre ikut terlihat. /metrics hanya
+menghitung satu worker; pakai satu worker (default --gunicorn) supaya query
+per detik mencakup seluruh server.
+"""
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from benchmark import beban, skala
+from benchmark.beban import KlienHttp, KlienLokal
+from benchmark.statistik import ringkas
+
+
+class Penonton(threading.Thread):
+    """Satu halaman laporan penjualan: login owner lalu baca stream sampai `berhenti`."""
+
+    def __init__(self, klien, berhenti):
+        super().__init__(daemon=True)
+        self.klien = klien
+        self.berhenti = berhenti
+        self.siap = threading.Event()
+        self.tersambung = False
+        self.penuh = False
+        self.event = 0
+
+    def run(self):
+        try:
+            self.klien.minta('POST', '/login', form={"username": "owner", "password": "owner"})
+            status, isi, tutup = self.klien.buka('/stream/stok')
+        except Exception:
+            self.siap.set()
+            return
+        try:
+            for potong in isi:
+                teks = potong.decode() if isinstance(potong, bytes) else potong
+                if 'event: siap' in teks:
+                    self.tersambung = True
+                    self.siap.set()
+                if 'event: penuh' in teks:
+                    self.penuh = True
+                self.event += teks.count('event: stok')
+                if self.berhenti.is_set():
+                    break
+        except Exception:
+            pass
+        finally:
+            self.siap.set()
+            tutup()
+
+
+def _query_total(klien, token):
+    """db_query_total server, atau NaN jika /metrics tidak menjawab (semua thread dipegang stream).
+
+    Tanpa token, `klien` harus sudah login sebagai owner.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else None
+    try:
+        status, body = klien.minta('GET', '/metrics', isi=True, headers=headers)
+    except Exception:
+        return float('nan')
+    if status == 401:
+        raise SystemExit("/metrics menjawab 401; login owner ditolak atau FLASK_METRIK_TOKEN beda dengan server")
+    if status != 200:
+        return float('nan')
+    for baris in body.decode().splitlines():
+        if baris.startswith('db_query_total '):
+            return float(baris.split()[1])
+    return 0.0
+
+
+def _satu_putaran(klien, penonton, kasir, durasi, akun_kasir, jumlah_roti, seed, token):
+    opsi = {"jumlah_roti": jumlah_roti, "jumlah_outlet": 1, "run": f"{time.time_ns():x}"}
+    berhenti_stream = threading.Event()
+    daftar_penonton = [Penonton(klien(), berhenti_stream) for _ in range(penonton)]
+    for p in daftar_penonton:
+        p.start()
+    for p in daftar_penonton:
+        p.siap.wait(30)
+
+    pemantau = klien()
+    if not token:
+        pemantau.minta('POST', '/login', form={"username": "owner", "password": "owner"})
+    query_awal = _query_total(pemantau, token)
+    berhenti = threading.Event()
+    daftar_kasir = [beban.Kasir(i % akun_kasir + 1, klien(), random.Random(seed + i), berhenti, 0.0, opsi)
+                    for i in range(kasir)]
+    mulai = time.perf_counter()
+    for k in daftar_kasir:
+        k.start()
+    berhenti.wait(durasi)
+    berhenti.set()
+    for k in daftar_kasir:
+        k.join()
+    lama = time.perf_counter() - mulai
+    # Pekerja outbox & pengamat masih menurunkan event terakhir; tunggu sebentar
+    time.sleep(1.5)
+    query = _query_total(pemantau, token) - query_awal
+
+    # Satu checkout lagi membangunkan semua stream supaya berhenti membaca dan menutup koneksi
+    berhenti_stream.set()
+    if daftar_penonton:
+        sapu = beban.Kasir(1, klien(), random.Random(seed), threading.Event(), 0.0, opsi)
+        sapu.login()
+        sapu.langkah()
+    for p in daftar_penonton:
+        p.join(20)
+
+    latensi = [x for k in daftar_kasir for x in k.latensi.get("POST /simpan_transaksi", [])]
+    # Termasuk login / Hitung_Total yang gagal: tanpa thread bebas kasir bahkan tidak bisa login
+    error = sum(n for k in daftar_kasir for n in k.error.values())
+    tersambung = [p for p in daftar_penonton if p.tersambung]
+    hasil = ringkas(latensi, lama, error)
+    # Nama kolom pendek supaya muat di tabel (lihat KOLOM_SSE)
+    hasil.update(
+        stream=len(tersambung),
+        ditolak=sum(p.penuh for p in daftar_penonton),
+        event=sum(p.event for p in tersambung) / len(tersambung) if tersambung else 0.0,
+        query_dtk=query / lama,
+        query_ckt=query / len(latensi) if latensi else 0.0,
+    )
+    return hasil
+
+
+def jalankan(app, daftar_penonton=(0, 100, 300), kasir=8, durasi=20, url=None, gunicorn=False, worker=1,
+             thread=8, port=5056, sse_maks=None, akun_kasir=3, jumlah_roti=12, seed=42):
+    """Kembalikan {"N penonton": ringkasan checkout + stream + query}."""
+    token = app.config['METRIK_TOKEN']
+    proses = None
+    if gunicorn:
+        url = f"http://127.0.0.1:{port}"
+        env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(worker), FLASK_WEB_THREAD=str(thread))
+        if sse_maks is not None:
+            env["FLASK_SSE_MAKS"] = str(sse_maks)
+        proses = subprocess.Popen([sys.executable, "-m", "gunicorn", "--log-level", "warning"],
+                                  cwd=skala.FOLDER_APP, env=env)
+    elif url is None:
+        app.config['SSE_MAKS'] = max(max(daftar_penonton), 1)
+
+    def klien():
+        return KlienHttp(url) if url else KlienLokal(app)
+
+    hasil = {}
+    try:
+        if proses is not None:
+            skala._tunggu_siap(url, proses)
+        for penonton in daftar_penonton:
+            r = _satu_putaran(klien, penonton, kasir, durasi, akun_kasir, jumlah_roti, seed, token)
+            hasil[f"{penonton} penonton"] = r
+            print(f"{penonton} penonton: {r['stream']} tersambung, {r['ditolak']} ditolak, "
+                  f"{r['query_ckt']:.1f} query/checkout", flush=True)
+    finally:
+        if proses is not None:
+            proses.send_signal(signal.SIGTERM)
+            proses.wait(timeout=60)
+    return hasil
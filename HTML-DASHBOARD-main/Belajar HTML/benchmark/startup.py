@@ -0,0 +1,68 @@
+"""Waktu start dingin: import app.py, create_app() dan request pertama.
+
+Setiap ulangan adalah proses Python baru (seperti worker yang baru di-spawn
+atau di-recycle), jadi tidak ada modul atau koneksi yang tersisa dari
+ulangan sebelumnya. Request pertama ke /login tidak menyentuh database;
+GET /Hitung_Total (halaman checkout kasir) membuka koneksi pertama dan
+memuat katalog roti.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmark.statistik import ringkas
+
+FOLDER_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KODE_ANAK = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import app as modul
+t1 = time.perf_counter()
+# app.py lama tidak punya create_app(); objek app modul dipakai supaya bisa dibandingkan
+aplikasi = modul.create_app() if hasattr(modul, 'create_app') else modul.app
+t2 = time.perf_counter()
+klien = aplikasi.test_client()
+login = klien.get('/login')
+login.get_data()
+t3 = time.perf_counter()
+with klien.session_transaction() as s:
+    s['role'] = 'Kasir'
+    s['username'] = 'kasir1'
+checkout = klien.get('/Hitung_Total')
+checkout.get_data()
+t4 = time.perf_counter()
+print(json.dumps({
+    "import app": t1 - t0,
+    "create_app": t2 - t1,
+    "GET /login pertama": t3 - t2,
+    "GET /Hitung_Total pertama": t4 - t3,
+    "status": [login.status_code, checkout.status_code],
+    "openpyxl": 'openpyxl' in sys.modules,
+}))
+"""
+
+LANGKAH = ("import app", "create_app", "GET /login pertama", "GET /Hitung_Total pertama")
+
+
+def jalankan(ulang=10):
+    """Jalankan `ulang` proses baru, kembalikan ({langkah: ringkasan}, openpyxl dimuat saat start)."""
+    latensi = {langkah: [] for langkah in LANGKAH + ("proses total",)}
+    openpyxl = False
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        keluaran = subprocess.run([sys.executable, "-c", KODE_ANAK], cwd=FOLDER_APP,
+                                  capture_output=True, text=True)
+        lama = time.perf_counter() - mulai
+        if keluaran.returncode != 0:
+            raise SystemExit(f"proses startup gagal:\n{keluaran.stderr}")
+        data = json.loads(keluaran.stdout.strip().splitlines()[-1])
+        if data["status"] != [200, 200]:
+            raise SystemExit(f"status request pertama {data['status']}; jalankan isi-data dulu")
+        for langkah in LANGKAH:
+            latensi[langkah].append(data[langkah])
+        latensi["proses total"].append(lama)
+        openpyxl = openpyxl or data["openpyxl"]
+    return {langkah: ringkas(nilai) for langkah, nilai in latensi.items()}, openpyxl
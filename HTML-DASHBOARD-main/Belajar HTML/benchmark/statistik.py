@@ -0,0 +1,62 @@
+"""Persentil, tabel hasil, dan perbandingan dengan hasil sebelumnya."""
+import json
+import math
+
+
+def persentil(nilai_urut, p):
+    """Persentil nearest-rank dari daftar yang sudah diurutkan."""
+    if not nilai_urut:
+        return 0.0
+    indeks = max(math.ceil(p / 100 * len(nilai_urut)) - 1, 0)
+    return nilai_urut[indeks]
+
+
+def ringkas(latensi, durasi=None, error=0):
+    """Ringkasan latensi (detik) dalam milidetik; throughput jika durasi diberikan."""
+    urut = sorted(latensi)
+    hasil = {
+        "jumlah": len(urut),
+        "error": error,
+        "min_ms": urut[0] * 1000 if urut else 0.0,
+        "p50_ms": persentil(urut, 50) * 1000,
+        "p95_ms": persentil(urut, 95) * 1000,
+        "p99_ms": persentil(urut, 99) * 1000,
+        "maks_ms": urut[-1] * 1000 if urut else 0.0,
+    }
+    if durasi:
+        hasil["per_detik"] = len(urut) / durasi
+    return hasil
+
+
+def cetak_tabel(hasil, kolom):
+    """Cetak {nama: ringkasan} sebagai tabel teks dengan kolom-kolom `kolom`."""
+    lebar_nama = max([len(nama) for nama in hasil] + [8])
+    print(f"{'':<{lebar_nama}}  " + "  ".join(f"{k:>10}" for k in kolom))
+    for nama, r in hasil.items():
+        sel = []
+        for k in kolom:
+            nilai = r.get(k, 0)
+            sel.append(f"{nilai:>10.2f}" if isinstance(nilai, float) else f"{nilai:>10}")
+        print(f"{nama:<{lebar_nama}}  " + "  ".join(sel))
+
+
+def simpan(path, hasil, info):
+    with open(path, "w") as f:
+        json.dump({"info": info, "hasil": hasil}, f, indent=2, sort_keys=True)
+
+
+def banding(path, hasil, kunci="p95_ms"):
+    """Cetak perubahan `kunci` (dan throughput jika ada) terhadap hasil di `path`."""
+    with open(path) as f:
+        dasar = json.load(f)["hasil"]
+    print(f"\nPerbandingan dengan {path} ({kunci}):")
+    for nama, r in hasil.items():
+        if nama not in dasar:
+            print(f"  {nama}: baru")
+            continue
+        lama, baru = dasar[nama].get(kunci, 0), r.get(kunci, 0)
+        ubah = (baru - lama) / lama * 100 if lama else 0.0
+        baris = f"  {nama}: {lama:.2f} -> {baru:.2f} ({ubah:+.1f}%)"
+        if "per_detik" in r and dasar[nama].get("per_detik"):
+            baris += f", throughput {(r['per_detik'] / dasar[nama]['per_detik'] - 1) * 100:+.1f}%"
+        print(baris)
@@ -0,0 +1,213 @@
+"""Uji stres konsistensi stok: ratusan kasir dan ESP32 menulis bersamaan.
+
+Database dikosongkan lalu hanya diisi outlet, user dan roti (isi_data tanpa
+hari), jadi stok akhir setiap roti di setiap outlet harus persis produksi -
+penjualan. Semua thread mulai bersamaan (barrier), kasir checkout dan ESP32
+mengirim produksi tunggal atau batch; setiap batch dikirim dua kali dengan
+idempotency_key yang sama, jadi kiriman ulang harus dilewati. Setelah outbox
+habis diproses, yang dibandingkan per outlet per roti:
+
+- respons 200 vs baris produksi / detail_transaksi di database
+- ringkasan_baru vs produksi / detail_transaksi (setiap event diturunkan sekali)
+- counter stok_roti dan Stok_Akhir stok_harian vs produksi - penjualan
+"""
+import json
+import random
+import threading
+import time
+
+from app import (db, pastikan_outbox, stok_terakhir_banyak, simpan_produksi, waktu_wib,
+                 DetailTransaksi, OutboxLedger, ProduksiHarian, RingkasanBaru, StokRoti, TransaksiPenjualan)
+from benchmark import data
+from benchmark.beban import KlienHttp, KlienLokal
+from benchmark.statistik import ringkas
+
+PRODUKSI_AWAL = 100
+
+
+class Penulis(threading.Thread):
+    """Satu kasir / ESP32; mencatat jumlah yang dijawab 200 per (idOutlet, idRoti)."""
+
+    def __init__(self, klien, rng, mulai, ulang, opsi):
+        super().__init__(daemon=True)
+        self.klien = klien
+        self.rng = rng
+        self.mulai = mulai
+        self.ulang = ulang
+        self.opsi = opsi
+        self.jumlah = {}
+        self.latensi = {}
+        self.error = {}
+
+    def kirim(self, label, metode, path, **kwargs):
+        awal = time.perf_counter()
+        try:
+            status, body = self.klien.minta(metode, path, isi=True, **kwargs)
+        except Exception:
+            status, body = None, b''
+        self.latensi.setdefault(label, []).append(time.perf_counter() - awal)
+        if status != 200:
+            self.error[label] = self.error.get(label, 0) + 1
+        return status, body
+
+    def catat(self, kunci, qty):
+        self.jumlah[kunci] = self.jumlah.get(kunci, 0) + qty
+
+    def run(self):
+        try:
+            self.siapkan()
+        finally:
+            self.mulai.wait()
+        for _ in range(self.ulang):
+            self.langkah()
+
+    def siapkan(self):
+        pass
+
+
+class Kasir(Penulis):
+    def __init__(self, nomor, *args):
+        super().__init__(*args)
+        self.nomor = nomor
+        self.idOutlet = (nomor - 1) % self.opsi['jumlah_outlet'] + 1
+
+    def siapkan(self):
+        akun = f"kasir{self.nomor}"
+        self.klien.minta('POST', '/login', form={"username": akun, "password": akun})
+
+    def langkah(self):
+        ids = self.rng.sample(range(1, self.opsi['jumlah_roti'] + 1), self.rng.randint(1, 3))
+        items = [{"idRoti": idRoti, "qty": self.rng.randint(1, 3)} for idRoti in ids]
+        status, _ = self.kirim("POST /simpan_transaksi", 'POST', '/simpan_transaksi',
+                               json_body={"total": 0, "bayar": 0, "kembalian": 0, "items": items})
+        if status == 200:
+            for item in items:
+                self.catat((self.idOutlet, item["idRoti"]), item["qty"])
+
+
+class Esp32(Penulis):
+    def langkah(self):
+        idOutlet = self.rng.randint(1, self.opsi['jumlah_outlet'])
+        if self.rng.random() < 0.5:
+            idRoti, qty = self.rng.randint(1, self.opsi['jumlah_roti']), self.rng.randint(1, 24)
+            status, _ = self.kirim("POST /esp32/input_produksi", 'POST', '/esp32/input_produksi', json_body={
+                "idRoti": idRoti, "idUser": 1, "idOutlet": idOutlet, "Jumlah_Produksi": qty})
+            if status == 200:
+                self.catat((idOutlet, idRoti), qty)
+            return
+
+        records = [{"idRoti": self.rng.randint(1, self.opsi['jumlah_roti']), "idUser": 1, "idOutlet": idOutlet,
+                    "Jumlah_Produksi": self.rng.randint(1, 24),
+                    "idempotency_key": f"{self.opsi['run']}-{self.name}-{self.rng.getrandbits(48):x}"}
+                   for _ in range(5)]
+        # Kiriman ulang (ESP32 tidak menerima jawaban) tidak boleh menambah produksi
+        for _ in range(2):
+            status, body = self.kirim("POST /esp32/input_produksi_batch", 'POST', '/esp32/input_produksi_batch',
+                                      json_body={"records": records})
+            if status != 200:
+                continue
+            for record, h in zip(records, json.loads(body)["hasil"]):
+                if h["status"] == "ok":
+                    self.catat((idOutlet, record["idRoti"]), record["Jumlah_Produksi"])
+
+
+def _jumlah_per_roti(query):
+    hasil = {}
+    for idOutlet, idRoti, jumlah in db.session.execute(query):
+        hasil[(idOutlet, idRoti)] = int(jumlah or 0)
+    return hasil
+
+
+def periksa(jumlah_outlet, jumlah_roti, dijawab_produksi, dijawab_terjual):
+    """Daftar baris perbedaan (kosong = konsisten); dijalankan di dalam app context."""
+    terakhir = db.session.execute(db.select(db.func.max(OutboxLedger.idOutbox))).scalar()
+    if terakhir is not None:
+        pastikan_outbox(terakhir)
+
+    produksi = _jumlah_per_roti(
+        db.select(ProduksiHarian.idOutlet, ProduksiHarian.idRoti, db.func.sum(ProduksiHarian.Jumlah_Produksi))
+        .group_by(ProduksiHarian.idOutlet, ProduksiHarian.idRoti))
+    terjual = _jumlah_per_roti(
+        db.select(TransaksiPenjualan.idOutlet, DetailTransaksi.id_roti, db.func.sum(DetailTransaksi.Jumlah))
+        .join(TransaksiPenjualan, TransaksiPenjualan.idTransaksi_Penjualan == DetailTransaksi.id_transaksi)
+        .group_by(TransaksiPenjualan.idOutlet, DetailTransaksi.id_roti))
+    ledger = {}
+    for idOutlet, idRoti, prod, jual in db.session.execute(
+            db.select(RingkasanBaru.idOutlet, ProduksiHarian.idRoti, db.func.sum(RingkasanBaru.Total_Produksi),
+                      db.func.sum(RingkasanBaru.Total_Terjual))
+            .join(ProduksiHarian, RingkasanBaru.idProduksi == ProduksiHarian.idProduksi)
+            .group_by(RingkasanBaru.idOutlet, ProduksiHarian.idRoti)):
+        ledger[(idOutlet, idRoti)] = (int(prod or 0), int(jual or 0))
+    counter = {(s.idOutlet, s.idRoti): s.Stok_Aktual for s in StokRoti.query}
+
+    beda = []
+    for idOutlet in range(1, jumlah_outlet + 1):
+        snapshot = stok_terakhir_banyak(range(1, jumlah_roti + 1), idOutlet)
+        for idRoti in range(1, jumlah_roti + 1):
+            kunci = (idOutlet, idRoti)
+            prod, jual = produksi.get(kunci, 0), terjual.get(kunci, 0)
+            harapan = prod - jual
+            nilai = {
+                "respons produksi": (dijawab_produksi.get(kunci, 0), prod),
+                "respons terjual": (dijawab_terjual.get(kunci, 0), jual),
+                "ledger produksi": (ledger.get(kunci, (0, 0))[0], prod),
+                "ledger terjual": (ledger.get(kunci, (0, 0))[1], jual),
+                "stok_roti": (counter.get(kunci, 0), harapan),
+                "stok_harian": (snapshot[idRoti], harapan),
+            }
+            for nama, (dapat, seharusnya) in nilai.items():
+                if dapat != seharusnya:
+                    beda.append(f"outlet {idOutlet} roti {idRoti} {nama}: {dapat}, seharusnya {seharusnya}")
+    return beda
+
+
+def jalankan(app, kasir=200, esp32=100, ulang=5, jumlah_roti=6, jumlah_outlet=2, url=None, seed=42, hapus=False):
+    """Jalankan uji stres; kembalikan ({label: ringkasan latensi}, [perbedaan])."""
+    jumlah_kasir = max(kasir, jumlah_outlet)
+    data.isi_data(app, hari=0, jumlah_roti=jumlah_roti, jumlah_kasir=jumlah_kasir,
+                  jumlah_outlet=jumlah_outlet, hapus=hapus)
+    dijawab_produksi = {}
+    with app.app_context():
+        # Checkout menolak roti yang belum pernah diproduksi di outlet itu
+        for idOutlet in range(1, jumlah_outlet + 1):
+            for idRoti in range(1, jumlah_roti + 1):
+                simpan_produksi(idRoti, data.ID_OWNER, PRODUKSI_AWAL, waktu_wib(), idOutlet)
+                dijawab_produksi[(idOutlet, idRoti)] = PRODUKSI_AWAL
+
+    opsi = {"jumlah_roti": jumlah_roti, "jumlah_outlet": jumlah_outlet, "run": f"{time.time_ns():x}"}
+    mulai = threading.Barrier(kasir + esp32 + 1)
+
+    def klien():
+        return KlienHttp(url) if url else KlienLokal(app)
+
+    rng = random.Random(seed)
+    kasir_list = [Kasir(i + 1, klien(), random.Random(rng.random()), mulai, ulang, opsi) for i in range(kasir)]
+    esp32_list = [Esp32(klien(), random.Random(rng.random()), mulai, ulang, opsi) for _ in range(esp32)]
+    semua = kasir_list + esp32_list
+    for t in semua:
+        t.start()
+    mulai.wait()
+    awal = time.perf_counter()
+    for t in semua:
+        t.join()
+    lama = time.perf_counter() - awal
+
+    dijawab_terjual = {}
+    for t in kasir_list:
+        for kunci, qty in t.jumlah.items():
+            dijawab_terjual[kunci] = dijawab_terjual.get(kunci, 0) + qty
+    for t in esp32_list:
+        for kunci, qty in t.jumlah.items():
+            dijawab_produksi[kunci] = dijawab_produksi.get(kunci, 0) + qty
+
+    latensi, error = {}, {}
+    for t in semua:
+        for label, nilai in t.latensi.items():
+            latensi.setdefault(label, []).extend(nilai)
+        for label, n in t.error.items():
+            error[label] = error.get(label, 0) + n
+    hasil = {label: ringkas(nilai, lama, error.get(label, 0)) for label, nilai in sorted(latensi.items())}
+
+    with app.app_context():
+        beda = periksa(jumlah_outlet, jumlah_roti, dijawab_produksi, dijawab_terjual)
+    return hasil, beda
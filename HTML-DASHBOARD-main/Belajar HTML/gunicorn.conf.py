@@ -0,0 +1,77 @@
+"""Konfigurasi gunicorn untuk produksi; dibaca otomatis oleh `gunicorn` dari folder ini.
+
+Setiap worker adalah proses gthread dengan beberapa thread request dan pool
+koneksi database sendiri. Jumlah worker dan thread yang benar-benar dipakai
+(termasuk jika -w / --threads diberikan di command line) diteruskan ke
+create_app() supaya ukuran pool cocok (lihat opsi_pool di app.py).
+
+Setiap stream SSE memegang satu thread selama terbuka; per worker paling
+banyak FLASK_SSE_MAKS stream (default setengah thread), sisanya ditolak
+dengan `event: penuh`. Untuk banyak layar, jalankan instance kedua khusus
+/stream/ (lihat README): satu worker, banyak thread, pool kecil.
+
+Environment: PORT (default 5000), WEB_CONCURRENCY (jumlah worker),
+FLASK_WEB_THREAD (thread per worker), dan semua variabel create_app().
+"""
+import multiprocessing
+import os
+import signal
+
+wsgi_app = "app:create_app()"
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# CPU-bound di Python (GIL): satu proses per core, beberapa thread untuk menutupi waktu tunggu database
+workers = int(os.environ.get("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 8)))
+threads = int(os.environ.get("FLASK_WEB_THREAD", 8))
+worker_class = "gthread"
+
+timeout = 60            # worker yang macet lebih dari ini di-restart master
+graceful_timeout = 30   # SIGTERM: waktu untuk request yang sedang berjalan sebelum worker dimatikan
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # create_app() di worker membaca FLASK_<NAMA> (lihat KONFIGURASI_DEFAULT);
+    # app dimuat setelah fork, jadi jangan pakai preload_app
+    os.environ["FLASK_WEB_WORKER"] = str(server.cfg.workers)
+    os.environ["FLASK_WEB_THREAD"] = str(server.cfg.threads)
+
+
+def post_worker_init(worker):
+    from app import mulai_berhenti
+
+    keluar = signal.getsignal(signal.SIGTERM)
+
+    def berhenti(sig, frame):
+        mulai_berhenti()
+        keluar(sig, frame)
+
+    signal.signal(signal.SIGTERM, berhenti)
+
+
+def worker_exit(server, worker):
+    from app import selesai_berhenti
+
+    if getattr(worker, "wsgi", None) is not None:
+        selesai_berhenti(worker.wsgi)
+
+
+def when_ready(server):
+    from app import create_app, opsi_pool
+
+    # Ringkasan pool untuk log deploy; konfigurasi dibaca seperti di worker
+    os.environ["FLASK_WEB_WORKER"] = str(server.cfg.workers)
+    os.environ["FLASK_WEB_THREAD"] = str(server.cfg.threads)
+    config = create_app().config
+    opsi = opsi_pool(config)
+    if "pool_size" in opsi:
+        per_worker = opsi["pool_size"] + opsi["max_overflow"]
+        server.log.info("%d worker x %d thread; pool per worker %d + overflow %d; koneksi maks %d (batas %d)",
+                        server.cfg.workers, server.cfg.threads, opsi["pool_size"], opsi["max_overflow"],
+                        server.cfg.workers * per_worker, config["DB_KONEKSI_MAKS"])
+        if opsi["pool_size"] * server.cfg.workers > config["DB_KONEKSI_MAKS"]:
+            server.log.warning("pool_size x worker melewati DB_KONEKSI_MAKS; kurangi worker atau thread")
+        elif opsi["max_overflow"] < config["OUTLET_PARALEL"]:
+            # Laporan semua outlet bisa menunggu koneksi sampai DB_POOL_TIMEOUT saat semua thread sibuk
+            server.log.warning("overflow %d < OUTLET_PARALEL %d karena DB_KONEKSI_MAKS",
+                               opsi["max_overflow"], config["OUTLET_PARALEL"])